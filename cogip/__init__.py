@@ -1,7 +1,5 @@
 import logging
 
-from dotenv import find_dotenv, load_dotenv
-
 # add devtools `debug` function to builtins
 try:
     from devtools import debug
@@ -10,12 +8,21 @@ except ImportError:
 else:
     __builtins__["debug"] = debug
 
+# load environment from the nearest .env file, if dotenv is available
+try:
+    from dotenv import find_dotenv, load_dotenv
+except ImportError:
+    pass
+else:
+    load_dotenv(find_dotenv(), verbose=False)
 
-load_dotenv(find_dotenv(), verbose=False)
-
-logging.basicConfig(
-    level=logging.INFO,  # logging.DEBUG
-    format="[%(asctime)s][%(name)s][%(threadName)s] %(levelname)s: %(message)s",
-)
+# Configure the root logger like `logging.basicConfig`, but with the raw record timestamp:
+# `%(asctime)s` would format the local time of each record.
+_root_logger = logging.getLogger()
+if not _root_logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("[%(created).3f][%(name)s][%(threadName)s] %(levelname)s: %(message)s"))
+    _root_logger.addHandler(_handler)
+    _root_logger.setLevel(logging.INFO)  # logging.DEBUG
 
 logger = logging.getLogger(__name__)
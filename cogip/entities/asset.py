@@ -8,10 +8,20 @@ It is typically used for table and robot assets.
 Supported asset files are in [Collada](https://en.wikipedia.org/wiki/COLLADA) format (`.dae`).
 Other formats could be also supported, but not tested
 (see [Open Asset Import Library](https://github.com/assimp/assimp)).
+
+For debugging, a [Graphviz](https://graphviz.org/) tree of the entities of each asset
+can be generated next to the asset file when it is loaded
+(see [`generate_tree`][cogip.entities.asset.AssetEntity.generate_tree]).
+It is disabled by default, it is enabled by the monitor `--dump-tree` option
+(or its `COGIP_DUMP_TREE` environment variable).
 """
 
+import os
+import stat
+from collections import deque
+from functools import cache
+from itertools import count
 from pathlib import Path
-from typing import TextIO
 
 from PySide6 import QtCore
 from PySide6.Qt3DCore import Qt3DCore
@@ -30,11 +40,14 @@ class AssetEntity(Qt3DCore.QEntity):
         asset_ready: `True` if the asset is ready
         asset_entity: first useful `QEntity` in the asset tree
         transform_component: `QTransform` holding the asset's translation and orientation
+        dump_tree: generate the dot tree of the asset when it is loaded
+            (disabled by default, enabled by the monitor `--dump-tree` option)
     """
 
     ready: qtSignal = qtSignal()
+    dump_tree: bool = False
 
-    def __init__(self, asset_path: Path, scale: float = 1.0, parent: Qt3DCore.QEntity = None):
+    def __init__(self, asset_path: Path | str, scale: float = 1.0, parent: Qt3DCore.QEntity = None):
         """
         The constructor checks the asset's file and starts loading the entity.
 
@@ -49,23 +62,20 @@ class AssetEntity(Qt3DCore.QEntity):
         super().__init__(parent)
 
         self.asset_ready: bool = False
-        self.asset_path: Path = asset_path
+        self.asset_path: Path = Path(asset_path)
         self.scale: float = scale
         self.asset_entity: Qt3DCore.QEntity = None
 
         self.transform_component = Qt3DCore.QTransform()
         self.addComponent(self.transform_component)
 
-        if not self.asset_path.exists():
-            raise FileNotFoundError(f"File not found '{self.asset_path}'")
-        if not self.asset_path.is_file():
-            raise IsADirectoryError(f"'{self.asset_path}' is not a file")
+        asset_url = validate_asset_path(self.asset_path)
 
         self.loader = Qt3DRender.QSceneLoader(self)
         self.loader.statusChanged.connect(self.on_loader_status_changed)
         self.loader.setObjectName(self.asset_path.name)
         self.addComponent(self.loader)
-        self.loader.setSource(QtCore.QUrl(f"file:{self.asset_path}"))
+        self.loader.setSource(asset_url)
 
     @qtSlot(Qt3DRender.QSceneLoader.Status)
     def on_loader_status_changed(self, status: Qt3DRender.QSceneLoader.Status):
@@ -73,7 +83,7 @@ class AssetEntity(Qt3DCore.QEntity):
         When the loader has finished, clean the entity tree,
         record the main `QEntity` and its `QTransform` component.
 
-        Then it generated the dot tree
+        Then it generated the dot tree if `dump_tree` is enabled
         (see [`generate_tree`][cogip.entities.asset.AssetEntity.generate_tree]),
         run the [`post_init`][cogip.entities.asset.AssetEntity.post_init] pass,
         and emit the `ready` signal.
@@ -88,7 +98,8 @@ class AssetEntity(Qt3DCore.QEntity):
 
         self.post_init()
 
-        self.generate_tree()
+        if self.dump_tree:
+            self.generate_tree()
 
         self.asset_ready = True
 
@@ -102,6 +113,10 @@ class AssetEntity(Qt3DCore.QEntity):
         but with `.tree.dot` extension.
 
         It is a text file written in [Graphviz](https://graphviz.org/) format.
+        It is not regenerated if it is more recent than the asset file.
+
+        The entity tree is walked in the Qt thread, but the file is written
+        by a worker of the global thread pool, so it does not delay the asset readiness.
 
         To read this file:
         ```bash
@@ -111,13 +126,18 @@ class AssetEntity(Qt3DCore.QEntity):
         """
 
         tree_filename = self.asset_path.with_suffix(".tree.dot")
-        with tree_filename.open(mode="w") as fd:
-            fd.write('graph ""\n')
-            fd.write("{\n")
-            fd.write('label="Entity tree"\n')
-            root_node_number = 0
-            traverse_tree(self, root_node_number, fd)
-            fd.write("}\n")
+        try:
+            if tree_filename.stat().st_mtime >= self.asset_path.stat().st_mtime:
+                return
+        except FileNotFoundError:
+            pass
+
+        parts = ['graph ""', "{", 'label="Entity tree"']
+        root_node_number = 0
+        traverse_tree(self, root_node_number, parts)
+        parts.append("}")
+
+        QtCore.QThreadPool.globalInstance().start(lambda: write_tree(tree_filename, parts))
 
     def post_init(self):
         """
@@ -127,36 +147,123 @@ class AssetEntity(Qt3DCore.QEntity):
         pass
 
 
-def traverse_tree(node: Qt3DCore.QEntity, next_node_nb: int, fd: TextIO) -> tuple[int, int]:
+@cache
+def validate_asset_path(asset_path: Path) -> QtCore.QUrl:
     """
-    Recursive function traversing all child entities and write its node
-    and all its components to the .dot file.
+    Check that the asset file exists and return its URL.
+
+    The result is cached, so each asset file is only checked once,
+    even if the asset is instantiated several times.
 
     Arguments:
-        node: entity to traverse
-        next_node_nb: next node number
-        fd: opened file descriptor used to write the tree
+        asset_path: path of the asset file
 
     Return:
-        tuple of current and next node numbers
+        URL of the asset file
+
+    Raises:
+        FileNotFoundError: the asset file does not exist
+        IsADirectoryError: the asset path is not a regular file
+    """
+    try:
+        asset_stat = os.stat(asset_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found '{asset_path}'") from None
+    if not stat.S_ISREG(asset_stat.st_mode):
+        raise IsADirectoryError(f"'{asset_path}' is not a file")
+    return QtCore.QUrl.fromLocalFile(str(asset_path))
+
+
+def write_tree(tree_filename: Path, lines: list[str]) -> None:
+    """
+    Write the lines of the .dot file.
+
+    The whole file is encoded at once and written in a single call.
+    QSaveFile writes to a temporary file renamed on commit,
+    so an interrupted dump never leaves a partial file.
+
+    Arguments:
+        tree_filename: path of the .dot file
+        lines: lines of the .dot file, without line terminators
+    """
+    tree_file = QtCore.QSaveFile(str(tree_filename))
+    if not tree_file.open(QtCore.QIODevice.WriteOnly):
+        return
+    tree_file.write(("\n".join(lines) + "\n").encode())
+    tree_file.commit()
+
+
+_class_names: dict[type, str] = {}
+
+
+def class_name(obj: QtCore.QObject) -> str:
     """
+    Return the Qt class name of an object, cached by Python type.
 
-    current_node_nb = next_node_nb
-    next_node_nb += 1
+    Objects created by Qt (like entities built by the scene loader) can be instances
+    of C++ classes without Python binding, so they are wrapped with the type of their
+    closest bound base class. The name is only cached if it matches the Python type,
+    since it could differ for other objects of the same Python type.
+
+    Arguments:
+        obj: object to get the class name of
+    """
+    obj_type = type(obj)
+    name = _class_names.get(obj_type)
+    if name is None:
+        name = obj.metaObject().className()
+        if name.rpartition("::")[2] == obj_type.__name__:
+            _class_names[obj_type] = name
+    return name
 
-    # Insert current node in the tree
-    fd.write(f'n{current_node_nb:03d} [label="{node.metaObject().className()}\n{node.objectName()}"] ;\n')
 
-    # Enumerate components
-    for comp in node.components():
-        fd.write(f'n{next_node_nb:03d} [shape=box,label="{comp.metaObject().className()}\n{comp.objectName()}"] ;\n')
-        fd.write(f"n{current_node_nb:03d} -- n{next_node_nb:03d} [style=dotted];\n")
-        next_node_nb += 1
+def traverse_tree(root: Qt3DCore.QEntity, next_node_nb: int, out: list[str]) -> None:
+    """
+    Traverse all child entities and add their nodes
+    and all their components to the .dot file content.
 
-    # Build tree for children
-    for child_node in node.children():
-        if isinstance(child_node, Qt3DCore.QEntity):
-            child_node_nb, next_node_nb = traverse_tree(child_node, next_node_nb, fd)
-            fd.write(f"n{current_node_nb:03d} -- n{child_node_nb:03d} ;\n")
+    The traversal uses an explicit stack instead of recursion,
+    so deep entity trees cannot hit the Python recursion limit.
+    Each node is followed by its components, then by the subtrees of its children,
+    each one followed by the edge linking it to its parent.
 
-    return current_node_nb, next_node_nb
+    Arguments:
+        root: entity to traverse
+        next_node_nb: number of the root node
+        out: list of lines of the .dot file, without line terminators
+    """
+    QEntity = Qt3DCore.QEntity
+    append = out.append
+    node_numbers = count(next_node_nb)
+
+    # Stack items are either an entity to insert with its parent node name,
+    # or an edge to insert once the subtree of a child is complete.
+    stack: deque[tuple[Qt3DCore.QEntity, str | None] | str] = deque([(root, None)])
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        item = pop()
+        if isinstance(item, str):
+            append(item)
+            continue
+
+        node, parent_node = item
+        current_node = f"n{next(node_numbers):03d}"
+
+        # Insert current node in the tree
+        append(f'{current_node} [label="{class_name(node)}\n{node.objectName()}"] ;')
+
+        # Enumerate components
+        for comp in node.components():
+            comp_node = f"n{next(node_numbers):03d}"
+            append(f'{comp_node} [shape=box,label="{class_name(comp)}\n{comp.objectName()}"] ;')
+            append(f"{current_node} -- {comp_node} [style=dotted];")
+
+        # Link to parent after the subtree of this node
+        if parent_node is not None:
+            push(f"{parent_node} -- {current_node} ;")
+
+        # Build tree for children, pushed in reverse order to be processed in order
+        stack.extend(
+            (child_node, current_node) for child_node in reversed(node.children()) if isinstance(child_node, QEntity)
+        )
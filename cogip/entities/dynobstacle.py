@@ -4,6 +4,7 @@ from PySide6.Qt3DExtras import Qt3DExtras
 
 from cogip.models import models
 from .path import PathEntity
+from .shared import shared_component
 
 
 class DynBaseObstacleEntity(Qt3DCore.QEntity):
@@ -11,22 +12,34 @@ class DynBaseObstacleEntity(Qt3DCore.QEntity):
     A dynamic obstacle detected by the robot.
 
     Base class for rectangle and circle obstacles.
+
+    Obstacles of the same scene share their material, and their mesh for a given shape:
+    meshes have a unit size and each obstacle is resized by the scale of its own transform.
+
+    Attributes:
+        height: Height of the obstacle
+        color: Translucent color of the obstacle
     """
 
+    height: float = 200.0
+    color: QtGui.QColor = QtGui.QColor.fromRgb(255, 0, 0, 100)
+
     def __init__(self, parent: Qt3DCore.QEntity):
         """
         Class constructor.
         """
         super().__init__(parent)
         self.parent = parent
-        self.points = []
-
-        self.material = Qt3DExtras.QDiffuseSpecularMaterial(self)
-        self.material.setDiffuse(QtGui.QColor.fromRgb(255, 0, 0, 100))
-        self.material.setDiffuse(QtGui.QColor.fromRgb(255, 0, 0, 100))
-        self.material.setSpecular(QtGui.QColor.fromRgb(255, 0, 0, 100))
-        self.material.setShininess(1.0)
-        self.material.setAlphaBlendingEnabled(True)
+        self.bb_coords: tuple[float, ...] | None = None  # Coordinates of the last bounding box
+        self.z_center = self.height / 2  # Translation to put the obstacle on the table
+        self.translation = QtGui.QVector3D(0, 0, self.z_center)  # Reused on each move, copied by setTranslation
+
+        self.material = shared_component(
+            self.parent,
+            Qt3DExtras.QDiffuseSpecularMaterial,
+            "DynObstacleMaterial",
+            self.create_material,
+        )
         self.addComponent(self.material)
 
         self.transform = Qt3DCore.QTransform(self)
@@ -34,11 +47,36 @@ class DynBaseObstacleEntity(Qt3DCore.QEntity):
 
         self.bb = PathEntity(QtCore.Qt.darkRed, self.parent)
 
+    @classmethod
+    def create_material(cls, parent: Qt3DCore.QEntity) -> Qt3DExtras.QDiffuseSpecularMaterial:
+        """
+        Create the material shared by dynamic obstacles.
+
+        Arguments:
+            parent: scene entity
+        """
+        material = Qt3DExtras.QDiffuseSpecularMaterial(parent)
+        material.setDiffuse(cls.color)
+        material.setSpecular(cls.color)
+        material.setShininess(1.0)
+        material.setAlphaBlendingEnabled(True)
+        return material
+
     def set_bounding_box(self, points: list[models.Vertex]) -> None:
-        if self.points == points:
+        """
+        Set the bounding box of the dynamic obstacle, if changed.
+
+        The bounding box coordinates are compared as a flat tuple of floats,
+        which is much cheaper than comparing the vertex models field by field.
+
+        Arguments:
+            points: Vertices of the bounding box
+        """
+        bb_coords = tuple(coord for point in points for coord in (point.x, point.y))
+        if self.bb_coords == bb_coords:
             return
 
-        self.points = points
+        self.bb_coords = bb_coords
         bb_points = []
         if points:
             for point in points:
@@ -47,6 +85,17 @@ class DynBaseObstacleEntity(Qt3DCore.QEntity):
         self.bb.set_points(bb_points)
 
     def setEnabled(self, isEnabled: bool) -> None:
+        """
+        Enable or disable the obstacle and its bounding box, if changed.
+
+        Pooled obstacles are enabled and disabled on each update,
+        most of the time without any change.
+
+        Arguments:
+            isEnabled: Whether the obstacle is displayed
+        """
+        if isEnabled == self.isEnabled():
+            return
         super().setEnabled(isEnabled)
         self.bb.setEnabled(isEnabled)
 
@@ -66,9 +115,23 @@ class DynRectObstacleEntity(DynBaseObstacleEntity):
         self.size: tuple[int, int] = None
         self.position: tuple[int, int, int] = None
 
-        self.mesh = Qt3DExtras.QCuboidMesh()
-        self.mesh.setZExtent(200)
+        self.mesh = shared_component(self.parent, Qt3DExtras.QCuboidMesh, "DynRectObstacleMesh", self.create_mesh)
         self.addComponent(self.mesh)
+        self.scale = QtGui.QVector3D(1, 1, 1)  # Reused on each resize, copied by setScale3D
+
+    @classmethod
+    def create_mesh(cls, parent: Qt3DCore.QEntity) -> Qt3DExtras.QCuboidMesh:
+        """
+        Create the unit cuboid mesh shared by rectangle obstacles.
+
+        Arguments:
+            parent: scene entity
+        """
+        mesh = Qt3DExtras.QCuboidMesh(parent)
+        mesh.setXExtent(1)
+        mesh.setYExtent(1)
+        mesh.setZExtent(cls.height)
+        return mesh
 
     def set_size(self, length: int, width: int) -> None:
         """
@@ -83,8 +146,9 @@ class DynRectObstacleEntity(DynBaseObstacleEntity):
 
         self.size = (length, width)
 
-        self.mesh.setXExtent(width)
-        self.mesh.setYExtent(length)
+        self.scale.setX(width)
+        self.scale.setY(length)
+        self.transform.setScale3D(self.scale)
 
     def set_position(self, x: int, y: int, rotation: int) -> None:
         """
@@ -100,7 +164,9 @@ class DynRectObstacleEntity(DynBaseObstacleEntity):
 
         self.position = (x, y, rotation)
 
-        self.transform.setTranslation(QtGui.QVector3D(x, y, self.mesh.zExtent() / 2))
+        self.translation.setX(x)
+        self.translation.setY(y)
+        self.transform.setTranslation(self.translation)
         self.transform.setRotationZ(rotation)
 
 
@@ -118,13 +184,25 @@ class DynCircleObstacleEntity(DynBaseObstacleEntity):
         super().__init__(parent)
         self.position: tuple[int, int, int] = None
 
-        self.mesh = Qt3DExtras.QCylinderMesh()
-        self.mesh.setLength(200)
-        self.mesh.setRadius(400)
+        self.mesh = shared_component(self.parent, Qt3DExtras.QCylinderMesh, "DynCircleObstacleMesh", self.create_mesh)
         self.addComponent(self.mesh)
+        self.scale = QtGui.QVector3D(1, 1, 1)  # Reused on each resize, copied by setScale3D
 
         self.transform.setRotationX(90)
 
+    @classmethod
+    def create_mesh(cls, parent: Qt3DCore.QEntity) -> Qt3DExtras.QCylinderMesh:
+        """
+        Create the unit radius cylinder mesh shared by circle obstacles.
+
+        Arguments:
+            parent: scene entity
+        """
+        mesh = Qt3DExtras.QCylinderMesh(parent)
+        mesh.setLength(cls.height)
+        mesh.setRadius(1)
+        return mesh
+
     def set_position(self, x: int, y: int, radius: int) -> None:
         """
         Set the position and size of the dynamic obstacle.
@@ -138,5 +216,10 @@ class DynCircleObstacleEntity(DynBaseObstacleEntity):
             return
         self.position = (x, y, radius)
 
-        self.transform.setTranslation(QtGui.QVector3D(x, y, self.mesh.length() / 2))
-        self.mesh.setRadius(radius)
+        self.translation.setX(x)
+        self.translation.setY(y)
+        self.transform.setTranslation(self.translation)
+        # The cylinder axis is the local Y axis, scaling is applied before the rotation
+        self.scale.setX(radius)
+        self.scale.setZ(radius)
+        self.transform.setScale3D(self.scale)
@@ -2,6 +2,8 @@ from PySide6 import QtCore, QtGui
 from PySide6.Qt3DCore import Qt3DCore
 from PySide6.Qt3DExtras import Qt3DExtras
 
+from .shared import shared_component
+
 
 class ImpactEntity(Qt3DCore.QEntity):
     """
@@ -9,24 +11,52 @@ class ImpactEntity(Qt3DCore.QEntity):
 
     It is represented with [`QSphereMesh`](https://doc.qt.io/qtforpython-6/PySide6/Qt3DExtras/QSphereMesh.html),
     its radius and color are configurable in the constructor.
+
+    Impact entities with the same parent share the same mesh for a given radius,
+    and the same material for a given color.
     """
 
-    def __init__(self, radius: float = 50, color: QtCore.Qt.GlobalColor = QtCore.Qt.red):
+    def __init__(
+        self,
+        radius: float = 50,
+        color: QtCore.Qt.GlobalColor = QtCore.Qt.red,
+        parent: Qt3DCore.QEntity | None = None,
+    ):
         """
         Class constructor.
 
         Arguments:
             radius: Radius of the sphere
             color: Color of the sphere
+            parent: Parent entity, also owning the shared mesh and material
         """
-        super().__init__()
+        super().__init__(parent)
 
-        self.mesh = Qt3DExtras.QSphereMesh()
-        self.mesh.setRadius(radius)
+        def create_mesh(parent: Qt3DCore.QEntity) -> Qt3DExtras.QSphereMesh:
+            mesh = Qt3DExtras.QSphereMesh(parent)
+            mesh.setRadius(radius)
+            return mesh
+
+        if parent is None:
+            self.mesh = create_mesh(self)
+        else:
+            self.mesh = shared_component(parent, Qt3DExtras.QSphereMesh, f"ImpactMesh{radius:g}", create_mesh)
         self.addComponent(self.mesh)
 
-        self.material = Qt3DExtras.QPhongMaterial()
-        self.material.setDiffuse(QtGui.QColor(color))
+        def create_material(parent: Qt3DCore.QEntity) -> Qt3DExtras.QPhongMaterial:
+            material = Qt3DExtras.QPhongMaterial(parent)
+            material.setDiffuse(QtGui.QColor(color))
+            return material
+
+        if parent is None:
+            self.material = create_material(self)
+        else:
+            self.material = shared_component(
+                parent,
+                Qt3DExtras.QPhongMaterial,
+                f"ImpactMaterial{QtGui.QColor(color).name(QtGui.QColor.HexArgb)}",
+                create_material,
+            )
         self.addComponent(self.material)
 
         self.transform = Qt3DCore.QTransform()
@@ -1,25 +1,57 @@
 from array import array
 
+import numpy as np
 from PySide6 import QtCore, QtGui
 from PySide6.Qt3DCore import Qt3DCore
 from PySide6.Qt3DExtras import Qt3DExtras
 from PySide6.Qt3DRender import Qt3DRender
 
 from cogip.models import models
+from .shared import shared_component
+
+
+def line_material(parent: Qt3DCore.QEntity, color: QtGui.QColor) -> Qt3DExtras.QPhongMaterial:
+    """
+    Return the material used to draw lines of the given color,
+    shared by all line and path entities with the same parent.
+
+    Arguments:
+        parent: entity owning the shared material
+        color: color of the lines
+    """
+
+    def create_material(parent: Qt3DCore.QEntity) -> Qt3DExtras.QPhongMaterial:
+        material = Qt3DExtras.QPhongMaterial(parent)
+        material.setAmbient(color)
+        return material
+
+    return shared_component(
+        parent,
+        Qt3DExtras.QPhongMaterial,
+        f"LineMaterial{QtGui.QColor(color).name(QtGui.QColor.HexArgb)}",
+        create_material,
+    )
 
 
 class LineEntity(Qt3DCore.QEntity):
     """
     A simple entity drawing a line between two vertices.
+
+    Line entities with the same parent share the same material for a given color.
+
+    Attributes:
+        indices_bytes: Indices of the start and end vertices, identical for all lines
     """
 
+    indices_bytes: QtCore.QByteArray = QtCore.QByteArray(array("I", [0, 1]).tobytes())
+
     def __init__(self, color: QtGui.QColor = QtCore.Qt.blue, parent: Qt3DCore.QEntity | None = None):
         """
         Class constructor.
 
         Arguments:
             color: color
-            parent: parent entity
+            parent: parent entity, also owning the shared material
         """
         super().__init__(parent)
         self.color = color
@@ -36,10 +68,9 @@ class LineEntity(Qt3DCore.QEntity):
         self.position_attribute.setCount(2)
         self.position_attribute.setBuffer(self.position_buffer)
         self.geometry.addAttribute(self.position_attribute)
+        self.positions = np.zeros(6, dtype=np.float32)  # Start and end vertices, filled in place
 
         # Connectivity between vertices
-        self.indices = array("I", [0, 1])
-        self.indices_bytes = QtCore.QByteArray(self.indices.tobytes())
         self.indices_buffer = Qt3DCore.QBuffer(self.geometry)
         self.indices_buffer.setData(self.indices_bytes)
 
@@ -54,8 +85,7 @@ class LineEntity(Qt3DCore.QEntity):
         self.line = Qt3DRender.QGeometryRenderer(self)
         self.line.setGeometry(self.geometry)
         self.line.setPrimitiveType(Qt3DRender.QGeometryRenderer.Lines)
-        self.material = Qt3DExtras.QPhongMaterial(self)
-        self.material.setAmbient(self.color)
+        self.material = line_material(self if parent is None else parent, self.color)
 
         # Entity
         self.addComponent(self.line)
@@ -71,8 +101,5 @@ class LineEntity(Qt3DCore.QEntity):
         """
 
         # Position vertices (start and end)
-        positions = array("f")
-        positions.fromlist([start.x, start.y, start.z])
-        positions.fromlist([end.x, end.y, end.z])
-        buffer_bytes = QtCore.QByteArray(positions.tobytes())
-        self.position_buffer.setData(buffer_bytes)
+        self.positions[:] = (start.x, start.y, start.z, end.x, end.y, end.z)
+        self.position_buffer.setData(QtCore.QByteArray(self.positions.tobytes()))
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.Qt3DCore import Qt3DCore
 from PySide6.Qt3DExtras import Qt3DExtras
@@ -6,7 +8,6 @@ from PySide6.QtCore import Signal as qtSignal
 from PySide6.QtCore import Slot as qtSlot
 
 from cogip import models
-from cogip.entities.sensor import Sensor
 
 
 class ObstacleEntity(Qt3DCore.QEntity):
@@ -20,12 +21,18 @@ class ObstacleEntity(Qt3DCore.QEntity):
 
     The obstacle can also be moved using the mouse.
 
+    It must be registered with [Sensor.add_obstacle][cogip.entities.sensor.Sensor.add_obstacle]
+    to be detected by the sensors.
+
     Attributes:
         enable_controller: Qt signal used to disable the camera controller
             when moving the obstacle using the mouse
+        move_released: Qt signal emitted when the mouse button is released after moving the obstacle,
+            before the obstacle stops applying move deltas
     """
 
     enable_controller = qtSignal(bool)
+    move_released = qtSignal()
 
     def __init__(
         self,
@@ -84,9 +91,9 @@ class ObstacleEntity(Qt3DCore.QEntity):
         self.beacon_entity.addComponent(self.beacon_material)
 
         self.beacon_transform = Qt3DCore.QTransform(self.beacon_entity)
-        self.beacon_transform.setTranslation(
-            QtGui.QVector3D(0, 0, self.mesh.zExtent() / 2 + self.beacon_mesh.length() / 2)
-        )
+        # Reused on each height change, copied by setTranslation
+        self.beacon_translation = QtGui.QVector3D(0, 0, self.mesh.zExtent() / 2 + self.beacon_mesh.length() / 2)
+        self.beacon_transform.setTranslation(self.beacon_translation)
         self.beacon_transform.setRotationX(90)
         self.beacon_entity.addComponent(self.beacon_transform)
 
@@ -100,11 +107,6 @@ class ObstacleEntity(Qt3DCore.QEntity):
         self.layer.setEnabled(True)
         self.addComponent(self.layer)
 
-        # Create properties dialog
-        self.properties = ObstacleProperties(self.parent_widget, self)
-
-        Sensor.add_obstacle(self)
-
     @qtSlot(float)
     def updateZTranslation(self, zExtent: float):
         """
@@ -112,20 +114,27 @@ class ObstacleEntity(Qt3DCore.QEntity):
 
         Update the Z position based on the obstacle height.
         This function is called each time the height is modified
-        to set the bottom on Z=0.
+        to set the bottom on Z=0 and keep the beacon on top of the obstacle.
         """
         translation = self.transform.translation()
+        if translation.z() == zExtent / 2:
+            return
         translation.setZ(zExtent / 2)
         self.transform.setTranslation(translation)
 
+        self.beacon_translation.setZ(zExtent / 2 + self.beacon_mesh.length() / 2)
+        self.beacon_transform.setTranslation(self.beacon_translation)
+
     @qtSlot(int)
     def setXTranslation(self, x: int):
         """
         Qt Slot
 
-        Set the X position.
+        Set the X position, if changed.
         """
         translation = self.transform.translation()
+        if translation.x() == x:
+            return
         translation.setX(float(x))
         self.transform.setTranslation(translation)
 
@@ -134,9 +143,11 @@ class ObstacleEntity(Qt3DCore.QEntity):
         """
         Qt Slot
 
-        Set the Y position.
+        Set the Y position, if changed.
         """
         translation = self.transform.translation()
+        if translation.y() == y:
+            return
         translation.setY(float(y))
         self.transform.setTranslation(translation)
 
@@ -163,13 +174,11 @@ class ObstacleEntity(Qt3DCore.QEntity):
 
         Emit a signal to re-enable the camera controller after moving the obstacle.
         """
-        if not self.moving:
-            if ObstacleProperties.active_properties:
-                ObstacleProperties.active_properties.close()
-            self.properties.show()
-            self.properties.raise_()
-            self.properties.activateWindow()
-            ObstacleProperties.set_active_properties(self.properties)
+        if self.moving:
+            # Apply move deltas still pending before ignoring them
+            self.move_released.emit()
+        else:
+            ObstacleProperties.display(self.parent_widget, self)
         self.moving = False
         self.enable_controller.emit(True)
 
@@ -217,33 +226,45 @@ class ObstacleEntity(Qt3DCore.QEntity):
         elif self.moving:
             new_translation = self.transform.translation() + delta
             self.transform.setTranslation(new_translation)
-            self.properties.spin_x.setValue(new_translation.x())
-            self.properties.spin_y.setValue(new_translation.y())
+            properties = ObstacleProperties.active_properties
+            if properties and properties.obstacle_entity is self:
+                # Do not loop back to setXTranslation/setYTranslation
+                properties.spin_x.blockSignals(True)
+                properties.spin_x.setValue(new_translation.x())
+                properties.spin_x.blockSignals(False)
+                properties.spin_y.blockSignals(True)
+                properties.spin_y.setValue(new_translation.y())
+                properties.spin_y.blockSignals(False)
 
 
 class ObstacleProperties(QtWidgets.QDialog):
     """
     The property window.
 
-    Each obstacle has its own property window.
+    A single property window is shared by all obstacles,
+    it is bound to the selected obstacle each time it is displayed.
 
     Attributes:
         active_properties: The current property window displayed.
+        saved_geometry: Geometry of the property window,
+            read from the settings on first display and saved on close.
+        instance: The property window shared by all obstacles, created on first display
     """
 
     active_properties: "ObstacleProperties" = None
+    saved_geometry: QtCore.QByteArray | None = None
+    instance: "ObstacleProperties | None" = None
 
-    def __init__(self, parent: QtWidgets.QWidget, obstacle_entity: ObstacleEntity):
+    def __init__(self, parent: QtWidgets.QWidget):
         """
         Class constructor.
 
         Arguments:
             parent: The parent widget
-            obstacle_entity: The related obstacle entity
         """
         super().__init__(parent)
 
-        self.obstacle_entity = obstacle_entity
+        self.obstacle_entity: ObstacleEntity | None = None
         self.setWindowTitle("Obstacle Properties")
         self.setModal(False)
         self.setMinimumWidth(self.fontMetrics().horizontalAdvance(self.windowTitle()))
@@ -258,8 +279,6 @@ class ObstacleProperties(QtWidgets.QDialog):
         self.spin_x.setStepType(QtWidgets.QAbstractSpinBox.AdaptiveDecimalStepType)
         self.spin_x.setMinimum(-1000)
         self.spin_x.setMaximum(1000)
-        self.spin_x.setValue(int(self.obstacle_entity.transform.translation().x()))
-        self.spin_x.valueChanged.connect(self.obstacle_entity.setXTranslation)
         layout.addWidget(label_x, row, 0)
         layout.addWidget(self.spin_x, row, 1)
         row += 1
@@ -269,8 +288,6 @@ class ObstacleProperties(QtWidgets.QDialog):
         self.spin_y.setStepType(QtWidgets.QAbstractSpinBox.AdaptiveDecimalStepType)
         self.spin_y.setMinimum(-1500)
         self.spin_y.setMaximum(1500)
-        self.spin_y.setValue(int(self.obstacle_entity.transform.translation().y()))
-        self.spin_y.valueChanged.connect(self.obstacle_entity.setYTranslation)
         layout.addWidget(label_y, row, 0)
         layout.addWidget(self.spin_y, row, 1)
         row += 1
@@ -280,8 +297,6 @@ class ObstacleProperties(QtWidgets.QDialog):
         self.spin_rotation.setSuffix("°")
         self.spin_rotation.setMinimum(-180)
         self.spin_rotation.setMaximum(180)
-        self.spin_rotation.setValue(int(self.obstacle_entity.transform.rotationZ()))
-        self.spin_rotation.valueChanged.connect(self.obstacle_entity.transform.setRotationZ)
         layout.addWidget(label_rotation, row, 0)
         layout.addWidget(self.spin_rotation, row, 1)
         row += 1
@@ -290,8 +305,6 @@ class ObstacleProperties(QtWidgets.QDialog):
         self.spin_width = QtWidgets.QSpinBox()
         self.spin_width.setMaximum(2000)
         self.spin_width.setSingleStep(10)
-        self.spin_width.setValue(int(self.obstacle_entity.mesh.xExtent()))
-        self.spin_width.valueChanged.connect(self.obstacle_entity.mesh.setXExtent)
         layout.addWidget(label_width, row, 0)
         layout.addWidget(self.spin_width, row, 1)
         row += 1
@@ -300,8 +313,6 @@ class ObstacleProperties(QtWidgets.QDialog):
         self.spin_length = QtWidgets.QSpinBox()
         self.spin_length.setMaximum(2000)
         self.spin_length.setSingleStep(10)
-        self.spin_length.setValue(int(self.obstacle_entity.mesh.yExtent()))
-        self.spin_length.valueChanged.connect(self.obstacle_entity.mesh.setYExtent)
         layout.addWidget(label_length, row, 0)
         layout.addWidget(self.spin_length, row, 1)
         row += 1
@@ -310,14 +321,75 @@ class ObstacleProperties(QtWidgets.QDialog):
         self.spin_height = QtWidgets.QSpinBox()
         self.spin_height.setMaximum(1000)
         self.spin_height.setSingleStep(10)
-        self.spin_height.setValue(int(self.obstacle_entity.mesh.zExtent()))
-        self.spin_height.valueChanged.connect(self.obstacle_entity.mesh.setZExtent)
         layout.addWidget(label_height, row, 0)
         layout.addWidget(self.spin_height, row, 1)
         row += 1
 
         self.readSettings()
 
+    @classmethod
+    def display(cls, parent: QtWidgets.QWidget, obstacle_entity: ObstacleEntity):
+        """
+        Class method.
+
+        Display the property window bound to an obstacle.
+
+        Arguments:
+            parent: The parent widget, used when the property window is created
+            obstacle_entity: The selected obstacle entity
+        """
+        if cls.instance is None:
+            cls.instance = cls(parent)
+        cls.instance.set_obstacle_entity(obstacle_entity)
+        cls.instance.show()
+        cls.instance.raise_()
+        cls.instance.activateWindow()
+        cls.set_active_properties(cls.instance)
+
+    def spin_bindings(
+        self,
+        obstacle_entity: ObstacleEntity,
+    ) -> list[tuple[QtWidgets.QSpinBox, float, Callable[[int], None]]]:
+        """
+        Return each spinbox with the obstacle property it edits: current value and setter.
+
+        Arguments:
+            obstacle_entity: The obstacle entity
+        """
+        translation = obstacle_entity.transform.translation()
+        return [
+            (self.spin_x, translation.x(), obstacle_entity.setXTranslation),
+            (self.spin_y, translation.y(), obstacle_entity.setYTranslation),
+            (self.spin_rotation, obstacle_entity.transform.rotationZ(), obstacle_entity.transform.setRotationZ),
+            (self.spin_width, obstacle_entity.mesh.xExtent(), obstacle_entity.mesh.setXExtent),
+            (self.spin_length, obstacle_entity.mesh.yExtent(), obstacle_entity.mesh.setYExtent),
+            (self.spin_height, obstacle_entity.mesh.zExtent(), obstacle_entity.mesh.setZExtent),
+        ]
+
+    def set_obstacle_entity(self, obstacle_entity: ObstacleEntity):
+        """
+        Bind the property window to an obstacle:
+        load its properties in the spinboxes and connect the spinboxes to its setters.
+
+        Arguments:
+            obstacle_entity: The obstacle entity
+        """
+        # Repaint the spinboxes once, after all values are loaded
+        self.setUpdatesEnabled(False)
+
+        if self.obstacle_entity is not None:
+            for spin, _, setter in self.spin_bindings(self.obstacle_entity):
+                spin.valueChanged.disconnect(setter)
+
+        self.obstacle_entity = obstacle_entity
+        bindings = self.spin_bindings(obstacle_entity)
+        for spin, value, _ in bindings:
+            spin.setValue(int(value))
+        for spin, _, setter in bindings:
+            spin.valueChanged.connect(setter)
+
+        self.setUpdatesEnabled(True)
+
     @classmethod
     def set_active_properties(cls, properties: "ObstacleProperties"):
         """
@@ -339,11 +411,14 @@ class ObstacleProperties(QtWidgets.QDialog):
         """
         ObstacleProperties.set_active_properties(None)
 
+        ObstacleProperties.saved_geometry = self.saveGeometry()
         settings = QtCore.QSettings("COGIP", "monitor")
-        settings.setValue("obstacle_dialog/geometry", self.saveGeometry())
+        settings.setValue("obstacle_dialog/geometry", ObstacleProperties.saved_geometry)
 
         super().closeEvent(event)
 
     def readSettings(self):
-        settings = QtCore.QSettings("COGIP", "monitor")
-        self.restoreGeometry(settings.value("obstacle_dialog/geometry"))
+        if ObstacleProperties.saved_geometry is None:
+            settings = QtCore.QSettings("COGIP", "monitor")
+            ObstacleProperties.saved_geometry = settings.value("obstacle_dialog/geometry")
+        self.restoreGeometry(ObstacleProperties.saved_geometry)
@@ -1,13 +1,18 @@
+import numpy as np
 from PySide6 import QtCore, QtGui
 from PySide6.Qt3DCore import Qt3DCore
+from PySide6.Qt3DRender import Qt3DRender
 
-from cogip.entities.line import LineEntity
+from cogip.entities.line import line_material
 from cogip.models import models
 
 
 class PathEntity(Qt3DCore.QEntity):
     """
     A simple entity drawing a path along a list of vertices.
+
+    All segments are drawn by a single geometry, with one pair of vertices per segment,
+    so updating the path only uploads one buffer and renders with one draw call.
     """
 
     def __init__(self, color: QtGui.QColor = QtCore.Qt.blue, parent: Qt3DCore.QEntity | None = None):
@@ -16,38 +21,51 @@ class PathEntity(Qt3DCore.QEntity):
 
         Arguments:
             color: color
-            parent: parent entity
+            parent: parent entity, also owning the shared material
         """
         super().__init__(parent)
         self.points = []
         self.color = color
-        self.lines: list[LineEntity] = []
-        self.lines_pool: list[LineEntity] = []
+
+        self.geometry = Qt3DCore.QGeometry(self)
+
+        self.position_buffer = Qt3DCore.QBuffer(self.geometry)
+
+        self.position_attribute = Qt3DCore.QAttribute(self.geometry)
+        self.position_attribute.setName(Qt3DCore.QAttribute.defaultPositionAttributeName())
+        self.position_attribute.setAttributeType(Qt3DCore.QAttribute.VertexAttribute)
+        self.position_attribute.setVertexBaseType(Qt3DCore.QAttribute.Float)
+        self.position_attribute.setVertexSize(3)
+        self.position_attribute.setCount(0)
+        self.position_attribute.setBuffer(self.position_buffer)
+        self.geometry.addAttribute(self.position_attribute)
+
+        # Mesh
+        self.line = Qt3DRender.QGeometryRenderer(self)
+        self.line.setGeometry(self.geometry)
+        self.line.setPrimitiveType(Qt3DRender.QGeometryRenderer.Lines)
+        self.material = line_material(self if parent is None else parent, self.color)
+
+        # Entity
+        self.addComponent(self.line)
+        self.addComponent(self.material)
 
     def set_points(self, points: list[models.Vertex]):
         """
         Set points of the path.
+        The path is cleared if there are less than 2 points.
 
         Arguments:
             points: list of vertices composing the line
         """
         self.points = points
 
-        if len(self.points) < 2:
-            return
-
-        for line in self.lines:
-            line.setEnabled(False)
-            self.lines_pool.append(line)
-
-        self.lines = []
-
-        start = self.points.pop(0)
-        for next in self.points:
-            if len(self.lines_pool) == 0:
-                self.lines_pool.append(LineEntity(self.color, self))
-            line = self.lines_pool.pop()
-            line.setEnabled(True)
-            line.set_points(start, next)
-            self.lines.append(line)
-            start = next
+        # Position vertices (start and end of each segment)
+        nb_segments = max(len(points) - 1, 0)
+        positions = np.empty((nb_segments, 2, 3), dtype=np.float32)
+        if nb_segments:
+            vertices = np.array([(point.x, point.y, point.z) for point in points], dtype=np.float32)
+            positions[:, 0] = vertices[:-1]
+            positions[:, 1] = vertices[1:]
+        self.position_buffer.setData(QtCore.QByteArray(positions.tobytes()))
+        self.position_attribute.setCount(nb_segments * 2)
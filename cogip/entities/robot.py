@@ -1,7 +1,7 @@
 from __future__ import annotations
-import math
 from pathlib import Path
 
+import numpy as np
 from PySide6 import QtCore, QtGui
 from PySide6.Qt3DCore import Qt3DCore
 from PySide6.Qt3DExtras import Qt3DExtras
@@ -13,6 +13,21 @@ from cogip.models import Pose
 from .asset import AssetEntity
 from .robot_order import RobotOrderEntity
 from .sensor import LidarSensor, Sensor, ToFSensor
+from .shared import shared_component
+
+LIDAR_RADIUS = 65.0 / 2
+
+# Angle of each LIDAR sensor (in degrees), in the order of the emitted sensors data
+LIDAR_ANGLES: tuple[int, ...] = tuple(((360 - np.arange(360)) % 360).tolist())
+LIDAR_NAMES: tuple[str, ...] = tuple(f"Lidar {angle}" for angle in LIDAR_ANGLES)
+
+# Origin of each LIDAR sensor on the circle around the top of the robot, computed once for all robots
+LIDAR_ORIGINS: tuple[tuple[float, float], ...] = tuple(
+    zip(
+        (LIDAR_RADIUS * np.cos(np.radians(LIDAR_ANGLES))).tolist(),
+        (LIDAR_RADIUS * np.sin(np.radians(LIDAR_ANGLES))).tolist(),
+    )
+)
 
 
 class RobotEntity(AssetEntity):
@@ -22,14 +37,23 @@ class RobotEntity(AssetEntity):
     Attributes:
         sensors_update_interval: Interval in milliseconds between each sensors update
         sensors_emit_interval: Interval in milliseconds between each sensors data emission
-        sensors_emit_data_signal: Qt Signal emitting sensors data
+        sensors_emit_data_signal: Qt Signal emitting sensors data,
+            the list of distances is passed as a Python object, without conversion
         order_robot:: Entity that represents the robot next destination
+        pose_tolerance: Minimum change of a pose coordinate (in mm or degrees) to update the entity
+        beacon_length: Length of the beacon cylinder
+        beacon_radius: Radius of the beacon cylinder
+        beacon_z: Z position of the beacon center, on top of the robot
     """
 
     sensors_update_interval: int = 5
     sensors_emit_interval: int = 20
-    sensors_emit_data_signal: qtSignal = qtSignal(int, list)
+    sensors_emit_data_signal: qtSignal = qtSignal(int, object)
     order_robot: RobotOrderEntity = None
+    pose_tolerance: float = 1e-3
+    beacon_length: float = 80.0
+    beacon_radius: float = 40.0
+    beacon_z: float = 350 + beacon_length / 2
 
     def __init__(self, robot_id: int, parent: Qt3DCore.QEntity | None = None):
         """
@@ -41,34 +65,56 @@ class RobotEntity(AssetEntity):
         super().__init__(asset_path, parent=parent)
         self.robot_id = robot_id
         self.sensors = []
-        self.rect_obstacles_pool = []
-        self.round_obstacles_pool = []
+        self.sensors_distances = np.empty(0, dtype=np.int32)  # Filled by sensors on each update
         self.beacon_entity: Qt3DCore.QEntity | None = None
+        self.last_position: tuple[float, float] | None = None
+        self.last_rotation: float | None = None
+        self.translation = QtGui.QVector3D()  # Reused for each new pose, it is copied by setTranslation
+        self.order_translation = QtGui.QVector3D()  # Reused for each new pose order
+        self.last_pose_order: tuple[float, float, float] | None = None
 
         if robot_id == 1:
             self.beacon_entity = Qt3DCore.QEntity(self)
-            self.beacon_mesh = Qt3DExtras.QCylinderMesh(self.beacon_entity)
-            self.beacon_mesh.setLength(80)
-            self.beacon_mesh.setRadius(40)
+            self.beacon_mesh = shared_component(
+                self if parent is None else parent,
+                Qt3DExtras.QCylinderMesh,
+                "RobotBeaconMesh",
+                self.create_beacon_mesh,
+            )
             self.beacon_entity.addComponent(self.beacon_mesh)
 
             self.beacon_transform = Qt3DCore.QTransform(self.beacon_entity)
-            self.beacon_transform.setTranslation(QtGui.QVector3D(0, 0, 350 + self.beacon_mesh.length() / 2))
+            self.beacon_transform.setTranslation(QtGui.QVector3D(0, 0, self.beacon_z))
             self.beacon_transform.setRotationX(90)
             self.beacon_entity.addComponent(self.beacon_transform)
 
-            # Create a layer used by sensors to activate detection on the beacon
+            # Create a layer used by sensors to activate detection on the beacon.
+            # The beacon mesh is a component of the beacon entity itself, it has no child to include.
             self.beacon_entity.layer = Qt3DRender.QLayer(self.beacon_entity)
-            self.beacon_entity.layer.setRecursive(True)
+            self.beacon_entity.layer.setRecursive(False)
             self.beacon_entity.layer.setEnabled(True)
             self.beacon_entity.addComponent(self.beacon_entity.layer)
 
         # Use a timer to trigger sensors update
         self.sensors_update_timer = QtCore.QTimer()
+        self.sensors_update_timer.timeout.connect(self.update_sensors)
 
         self.sensors_emit_timer = QtCore.QTimer()
         self.sensors_emit_timer.timeout.connect(self.emit_sensors_data)
 
+    @classmethod
+    def create_beacon_mesh(cls, parent: Qt3DCore.QEntity) -> Qt3DExtras.QCylinderMesh:
+        """
+        Create the beacon mesh shared by robots.
+
+        Arguments:
+            parent: scene entity
+        """
+        mesh = Qt3DExtras.QCylinderMesh(parent)
+        mesh.setLength(cls.beacon_length)
+        mesh.setRadius(cls.beacon_radius)
+        return mesh
+
     def post_init(self):
         """
         Function called once the asset has been loaded.
@@ -82,6 +128,10 @@ class RobotEntity(AssetEntity):
         else:
             self.add_tof_sensor()
 
+        self.sensors_distances = np.empty(len(self.sensors), dtype=np.int32)
+        for index, sensor in enumerate(self.sensors):
+            sensor.bind_distances(self.sensors_distances, index)
+
         self.order_robot = RobotOrderEntity(self.parent(), self.robot_id)
 
         if self.beacon_entity:
@@ -93,28 +143,15 @@ class RobotEntity(AssetEntity):
         one by degree around the top of the robot.
         """
 
-        radius = 65.0 / 2
-
-        sensors_properties = []
-
-        for i in range(0, 360):
-            angle = (360 - i) % 360
-            origin_x = radius * math.sin(math.radians(90 - angle))
-            origin_y = radius * math.cos(math.radians(90 - angle))
-            sensors_properties.append(
-                {
-                    "name": f"Lidar {angle}",
-                    "origin_x": origin_x,
-                    "origin_y": origin_y,
-                    "direction_x": origin_x,
-                    "direction_y": origin_y,
-                }
+        for name, (origin_x, origin_y) in zip(LIDAR_NAMES, LIDAR_ORIGINS):
+            sensor = LidarSensor(
+                asset_entity=self,
+                name=name,
+                origin_x=origin_x,
+                origin_y=origin_y,
+                direction_x=origin_x,
+                direction_y=origin_y,
             )
-
-        # Add sensors
-        for prop in sensors_properties:
-            sensor = LidarSensor(asset_entity=self, **prop)
-            self.sensors_update_timer.timeout.connect(sensor.update_hit)
             self.sensors.append(sensor)
 
     def add_tof_sensor(self):
@@ -122,7 +159,6 @@ class RobotEntity(AssetEntity):
         Add a ToF sensor in front of the robot entity.
         """
         sensor = ToFSensor(asset_entity=self, name="ToF", origin_x=106, origin_y=0)
-        self.sensors_update_timer.timeout.connect(sensor.update_hit)
         self.sensors.append(sensor)
 
     @qtSlot(Pose)
@@ -130,23 +166,58 @@ class RobotEntity(AssetEntity):
         """
         Qt slot called to set the robot's new pose current.
 
+        The transform is only updated if the pose has changed,
+        since the same pose is often received while the robot is not moving.
+
         Arguments:
             new_pose: new robot pose
         """
-        self.transform_component.setTranslation(QtGui.QVector3D(new_pose.x, new_pose.y, 0))
-        self.transform_component.setRotationZ(new_pose.O)
+        x, y, angle = new_pose.x, new_pose.y, new_pose.O
+        tolerance = self.pose_tolerance
+
+        last_position = self.last_position
+        if last_position is None or abs(x - last_position[0]) > tolerance or abs(y - last_position[1]) > tolerance:
+            self.last_position = (x, y)
+            self.translation.setX(x)
+            self.translation.setY(y)
+            self.transform_component.setTranslation(self.translation)
+
+        if self.last_rotation is None or abs(angle - self.last_rotation) > tolerance:
+            self.last_rotation = angle
+            self.transform_component.setRotationZ(angle)
 
     @qtSlot(Pose)
     def new_robot_pose_order(self, new_pose: Pose) -> None:
         """
         Qt slot called to set the robot's new pose order.
 
+        The transform is only updated if the pose order has changed,
+        since the same order is received until the robot reaches it.
+
         Arguments:
             new_pose: new robot pose
         """
-        if self.order_robot:
-            self.order_robot.transform.setTranslation(QtGui.QVector3D(new_pose.x, new_pose.y, 0))
-            self.order_robot.transform.setRotationZ(new_pose.O)
+        if not self.order_robot:
+            return
+
+        pose_order = (new_pose.x, new_pose.y, new_pose.O)
+        if pose_order == self.last_pose_order:
+            return
+        self.last_pose_order = pose_order
+
+        self.order_translation.setX(new_pose.x)
+        self.order_translation.setY(new_pose.y)
+        self.order_robot.transform.setTranslation(self.order_translation)
+        self.order_robot.transform.setRotationZ(new_pose.O)
+
+    @qtSlot()
+    def update_sensors(self) -> None:
+        """
+        Qt Slot called to update all sensors at once,
+        instead of connecting the update timer to each sensor.
+        """
+        for sensor in self.sensors:
+            sensor.update_hit()
 
     def start_sensors_emulation(self) -> None:
         """
@@ -166,11 +237,13 @@ class RobotEntity(AssetEntity):
         """
         Return a list of distances for each 360 Lidar angles or ToF distance.
         """
-        return [sensor.distance for sensor in self.sensors]
+        return self.sensors_distances.tolist()
 
     @qtSlot()
     def emit_sensors_data(self) -> None:
         """
         Qt Slot called to emit sensors data.
+
+        Sensors data are only collected while the sensors emulation is requested by the server.
         """
         self.sensors_emit_data_signal.emit(self.robot_id, self.sensors_data())
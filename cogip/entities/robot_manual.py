@@ -5,6 +5,8 @@ from PySide6.Qt3DRender import Qt3DRender
 from PySide6.QtCore import Signal as qtSignal
 from PySide6.QtCore import Slot as qtSlot
 
+from .robot_order import robot_mesh
+
 
 class RobotManualEntity(Qt3DCore.QEntity):
     """
@@ -19,10 +21,13 @@ class RobotManualEntity(Qt3DCore.QEntity):
         color: Robot color
         enable_controller: Qt signal used to disable the camera controller
             when moving the robot using the mouse
+        move_released: Qt signal emitted when the mouse button is released after moving the robot,
+            before the robot stops applying move deltas
     """
 
     color: QtGui.QColor = QtGui.QColor.fromRgb(17, 70, 92, 100)
     enable_controller = qtSignal(bool)
+    move_released = qtSignal()
 
     def __init__(
         self,
@@ -47,8 +52,7 @@ class RobotManualEntity(Qt3DCore.QEntity):
 
         self.parent_widget = parent_widget
 
-        self.mesh = Qt3DRender.QMesh(self)
-        self.mesh.setSource(QtCore.QUrl(f"file:assets/{'robot' if robot_id == 1 else 'pami'}2024.stl"))
+        self.mesh = robot_mesh(parent, robot_id)
         self.addComponent(self.mesh)
 
         self.material = Qt3DExtras.QPhongMaterial(self)
@@ -77,17 +81,19 @@ class RobotManualEntity(Qt3DCore.QEntity):
         self.layer.setEnabled(True)
         self.addComponent(self.layer)
 
-        # Create properties dialog
-        self.properties = RobotManualProperties(self.parent_widget, self)
+        # Properties dialog, created on first display
+        self.properties: RobotManualProperties | None = None
 
     @qtSlot(int)
     def setXTranslation(self, x: int):
         """
         Qt Slot
 
-        Set the X position.
+        Set the X position, if changed.
         """
         translation = self.transform.translation()
+        if translation.x() == x:
+            return
         translation.setX(float(x))
         self.transform.setTranslation(translation)
 
@@ -96,9 +102,11 @@ class RobotManualEntity(Qt3DCore.QEntity):
         """
         Qt Slot
 
-        Set the Y position.
+        Set the Y position, if changed.
         """
         translation = self.transform.translation()
+        if translation.y() == y:
+            return
         translation.setY(float(y))
         self.transform.setTranslation(translation)
 
@@ -125,9 +133,14 @@ class RobotManualEntity(Qt3DCore.QEntity):
 
         Emit a signal to re-enable the camera controller after moving the robot.
         """
-        if not self.moving:
+        if self.moving:
+            # Apply move deltas still pending before ignoring them
+            self.move_released.emit()
+        else:
             if RobotManualProperties.active_properties:
                 RobotManualProperties.active_properties.close()
+            if self.properties is None:
+                self.properties = RobotManualProperties(self.parent_widget, self)
             self.properties.show()
             self.properties.raise_()
             self.properties.activateWindow()
@@ -162,8 +175,14 @@ class RobotManualEntity(Qt3DCore.QEntity):
         elif self.moving:
             new_translation = self.transform.translation() + delta
             self.transform.setTranslation(new_translation)
-            self.properties.spin_x.setValue(new_translation.x())
-            self.properties.spin_y.setValue(new_translation.y())
+            if self.properties:
+                # Do not loop back to setXTranslation/setYTranslation
+                self.properties.spin_x.blockSignals(True)
+                self.properties.spin_x.setValue(new_translation.x())
+                self.properties.spin_x.blockSignals(False)
+                self.properties.spin_y.blockSignals(True)
+                self.properties.spin_y.setValue(new_translation.y())
+                self.properties.spin_y.blockSignals(False)
 
 
 class RobotManualProperties(QtWidgets.QDialog):
@@ -172,9 +191,12 @@ class RobotManualProperties(QtWidgets.QDialog):
 
     Attributes:
         active_properties: The current property window displayed.
+        saved_geometry: Geometry shared by all property windows,
+            read from the settings by the first window and saved on close.
     """
 
     active_properties: "RobotManualProperties" = None
+    saved_geometry: QtCore.QByteArray | None = None
 
     def __init__(self, parent: QtWidgets.QWidget, robot_entity: RobotManualEntity):
         """
@@ -252,11 +274,14 @@ class RobotManualProperties(QtWidgets.QDialog):
         """
         RobotManualProperties.set_active_properties(None)
 
+        RobotManualProperties.saved_geometry = self.saveGeometry()
         settings = QtCore.QSettings("COGIP", "monitor")
-        settings.setValue("manual_robot_dialog/geometry", self.saveGeometry())
+        settings.setValue("manual_robot_dialog/geometry", RobotManualProperties.saved_geometry)
 
         super().closeEvent(event)
 
     def readSettings(self):
-        settings = QtCore.QSettings("COGIP", "monitor")
-        self.restoreGeometry(settings.value("manual_robot_dialog/geometry"))
+        if RobotManualProperties.saved_geometry is None:
+            settings = QtCore.QSettings("COGIP", "monitor")
+            RobotManualProperties.saved_geometry = settings.value("manual_robot_dialog/geometry")
+        self.restoreGeometry(RobotManualProperties.saved_geometry)
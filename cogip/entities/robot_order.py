@@ -3,6 +3,41 @@ from PySide6.Qt3DCore import Qt3DCore
 from PySide6.Qt3DExtras import Qt3DExtras
 from PySide6.Qt3DRender import Qt3DRender
 
+from .shared import shared_component
+
+robot_mesh_urls: dict[bool, QtCore.QUrl] = {
+    True: QtCore.QUrl("file:assets/robot2024.stl"),
+    False: QtCore.QUrl("file:assets/pami2024.stl"),
+}
+
+
+def robot_mesh_url(robot_id: int) -> QtCore.QUrl:
+    """
+    Return the URL of the mesh representing a robot.
+
+    Arguments:
+        robot_id: ID of the robot, 1 for the main robot, PAMIs otherwise
+    """
+    return robot_mesh_urls[robot_id == 1]
+
+
+def robot_mesh(parent: Qt3DCore.QEntity, robot_id: int) -> Qt3DRender.QMesh:
+    """
+    Return the mesh representing a robot, shared by all robot entities with the same parent,
+    so the STL file is only loaded once for each kind of robot.
+
+    Arguments:
+        parent: entity owning the shared mesh
+        robot_id: ID of the robot, 1 for the main robot, PAMIs otherwise
+    """
+
+    def create_mesh(parent: Qt3DCore.QEntity) -> Qt3DRender.QMesh:
+        mesh = Qt3DRender.QMesh(parent)
+        mesh.setSource(robot_mesh_url(robot_id))
+        return mesh
+
+    return shared_component(parent, Qt3DRender.QMesh, "RobotMesh" if robot_id == 1 else "PamiMesh", create_mesh)
+
 
 class RobotOrderEntity(Qt3DCore.QEntity):
     """
@@ -20,8 +55,7 @@ class RobotOrderEntity(Qt3DCore.QEntity):
         """
         super().__init__(parent)
 
-        mesh = Qt3DRender.QMesh(self)
-        mesh.setSource(QtCore.QUrl(f"file:assets/{'robot' if robot_id == 1 else 'pami'}2024.stl"))
+        mesh = robot_mesh(parent, robot_id)
 
         self.transform = Qt3DCore.QTransform(self)
 
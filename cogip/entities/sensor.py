@@ -1,5 +1,6 @@
 import math
 
+import numpy as np
 from PySide6 import QtCore, QtGui
 from PySide6.Qt3DCore import Qt3DCore
 from PySide6.Qt3DExtras import Qt3DExtras
@@ -66,6 +67,9 @@ class Sensor(QtCore.QObject):
 
         self.origin_x = origin_x
         self.origin_y = origin_y
+        self.origin_distance = math.dist((0, 0), (origin_x, origin_y))
+        self.distances: np.ndarray | None = None
+        self.distance_index: int = 0
         self.asset_entity = asset_entity
         self.name = name
 
@@ -79,12 +83,14 @@ class Sensor(QtCore.QObject):
         self.asset_entity.addComponent(self.ray_caster)
 
         # Add layers for obstacles already present
-        for obstacle in self.obstacles:
-            self.add_obstacle_layer(obstacle)
+        self.add_obstacle_layers(self.obstacles)
 
         # Add impact entity
-        self.impact_entity = ImpactEntity(radius=impact_radius, color=impact_color)
-        self.impact_entity.setParent(self.asset_entity.parent().parent().parent())
+        self.impact_entity = ImpactEntity(
+            radius=impact_radius,
+            color=impact_color,
+            parent=self.asset_entity.parent().parent().parent(),
+        )
 
     @qtSlot()
     def update_hit(self):
@@ -98,8 +104,24 @@ class Sensor(QtCore.QObject):
         if len(distances):
             self.hit = min(distances, key=lambda x: x.distance())
 
+        if self.distances is not None:
+            self.distances[self.distance_index] = self.distance
+
         self.update_impact()
 
+    def bind_distances(self, distances: np.ndarray, index: int):
+        """
+        Write the sensor distance in a slot of an array shared by several sensors,
+        on each update, so all distances can be read at once.
+
+        Arguments:
+            distances: Array of distances
+            index: Index of this sensor in the array
+        """
+        self.distances = distances
+        self.distance_index = index
+        distances[index] = self.distance
+
     def update_impact(self):
         """
         Display the impact entity at the collision point.
@@ -120,19 +142,37 @@ class Sensor(QtCore.QObject):
         Arguments:
             obstacle: The obstacle to register
         """
-        cls.obstacles.append(obstacle)
+        cls.add_obstacles([obstacle])
+
+    @classmethod
+    def add_obstacles(cls, obstacles: list[Qt3DCore.QEntity]):
+        """
+        Class method.
+
+        Register several obstacles added on the table at once,
+        each sensor is only triggered once.
+
+        Arguments:
+            obstacles: The obstacles to register
+        """
+        if not obstacles:
+            return
+        cls.obstacles.extend(obstacles)
         for sensor in cls.all_sensors:
-            sensor.add_obstacle_layer(obstacle)
+            sensor.add_obstacle_layers(obstacles)
 
-    def add_obstacle_layer(self, obstacle: Qt3DCore.QEntity):
+    def add_obstacle_layers(self, obstacles: list[Qt3DCore.QEntity]):
         """
-        Add the obstacle layer to the ray caster.
-        This allows the obstacle to be detected by the ray caster.
+        Add the obstacle layers to the ray caster.
+        This allows the obstacles to be detected by the ray caster.
 
         Arguments:
-            obstacle: The obstacle to detect
+            obstacles: The obstacles to detect
         """
-        self.ray_caster.addLayer(obstacle.layer)
+        if not obstacles:
+            return
+        for obstacle in obstacles:
+            self.ray_caster.addLayer(obstacle.layer)
         # Activate if not already done
         self.ray_caster.trigger()
 
@@ -144,7 +184,7 @@ class Sensor(QtCore.QObject):
         dist = 65535
         if self.hit:
             dist = self.hit.distance()
-            dist += math.dist((0, 0), (self.origin_x, self.origin_y))
+            dist += self.origin_distance
         return int(dist)
 
 
@@ -0,0 +1,42 @@
+"""
+Helpers to share Qt3D components between entities.
+
+Qt3D components (meshes, materials, ...) can be added to several entities.
+Sharing identical components avoids duplicating their backend resources
+(geometry buffers, shader parameters) for each entity.
+
+Shared components are children of a common ancestor entity (typically the scene),
+identified by their object name, so they live as long as this ancestor.
+"""
+
+from collections.abc import Callable
+from typing import TypeVar
+
+from PySide6 import QtCore
+from PySide6.Qt3DCore import Qt3DCore
+
+ComponentType = TypeVar("ComponentType", bound=Qt3DCore.QComponent)
+
+
+def shared_component(
+    parent: Qt3DCore.QEntity,
+    component_type: type[ComponentType],
+    name: str,
+    create: Callable[[Qt3DCore.QEntity], ComponentType],
+) -> ComponentType:
+    """
+    Return a component shared by all entities using the same parent and name.
+
+    It is created as a child of the parent entity on first use.
+
+    Arguments:
+        parent: entity owning the shared component
+        component_type: type of the component
+        name: object name identifying the component in the parent children
+        create: function creating the component with the parent entity as parent
+    """
+    component = parent.findChild(component_type, name, QtCore.Qt.FindDirectChildrenOnly)
+    if component is None:
+        component = create(parent)
+        component.setObjectName(name)
+    return component
@@ -4,7 +4,7 @@ from multiprocessing import Process
 import uvicorn
 
 from .camera import CameraHandler
-from .settings import Settings
+from .settings import get_settings
 
 
 def start_camera_handler():
@@ -19,7 +19,7 @@ def main() -> None:
     During installation of cogip-tools, `setuptools` is configured
     to create the `cogip-beaconcam` script using this function as entrypoint.
     """
-    settings = Settings()
+    settings = get_settings()
 
     # Start Camera handler process
     p = Process(target=start_camera_handler)
@@ -12,7 +12,7 @@ from uvicorn.main import Server as UvicornServer
 
 from cogip import logger
 from cogip.tools.planner.camp import Camp
-from .settings import Settings
+from .settings import get_settings
 
 
 class CameraServer:
@@ -32,7 +32,7 @@ class CameraServer:
 
         Create FastAPI application and SocketIO client.
         """
-        self.settings = Settings()
+        self.settings = get_settings()
         CameraServer._exiting = False
 
         self.app = FastAPI(title="COGIP Beacon Camera Streamer", debug=False)
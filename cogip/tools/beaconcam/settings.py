@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import AnyHttpUrl, Field, FilePath
@@ -38,3 +39,11 @@ class Settings(BaseSettings):
         default=1,
         description="Number of uvicorn workers (ignored if launched by gunicorn)",
     )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the settings, parsed from the environment on first call only.
+    """
+    return Settings()
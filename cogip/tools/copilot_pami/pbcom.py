@@ -1,6 +1,7 @@
 import asyncio
 import base64
 import binascii
+import logging
 from collections.abc import Callable
 from pathlib import Path
 
@@ -124,7 +125,8 @@ class PBCom:
         try:
             while True:
                 uuid, pb_message = await self._serial_messages_to_send.get()
-                logger.info(f"Send PB message: {uuid} {pb_message}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Send PB message: {uuid} {pb_message}")
                 await self._serial_port.write_async(uuid.to_bytes(4, "little"))
                 if pb_message:
                     response_serialized = await self._loop.run_in_executor(None, pb_message.SerializeToString)
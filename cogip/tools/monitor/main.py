@@ -9,12 +9,6 @@ import sys
 os.environ["QT_LOGGING_RULES"] = "*.debug=false;qt.webenginecontext.info=false"
 
 import typer
-from PySide6 import QtGui, QtWidgets
-
-from cogip.entities.table import TableEntity
-from .mainwindow import MainWindow
-from .robots import RobotManager
-from .socketiocontroller import SocketioController
 
 
 def main_opt(
@@ -23,12 +17,30 @@ def main_opt(
         envvar="COGIP_SOCKETIO_SERVER_URL",
         help="Socket.IO Server URL",
     ),
+    dump_tree: bool = typer.Option(
+        False,
+        "--dump-tree",
+        envvar=["COGIP_DUMP_TREE", "MONITOR_DUMP_TREE"],
+        help="Generate the Graphviz entity tree of loaded assets (next to asset files)",
+    ),
 ) -> None:
     """
     Launch COGIP Monitor.
     """
+    # Qt modules are imported after arguments parsing,
+    # so `--help` and arguments errors do not have to load them.
+    from PySide6 import QtCore, QtGui, QtWidgets
+
+    from cogip.entities.asset import AssetEntity
+    from cogip.entities.table import TableEntity
+    from .mainwindow import MainWindow
+    from .robots import RobotManager
+    from .socketiocontroller import SocketioController
+
     faulthandler.enable()
 
+    AssetEntity.dump_tree = dump_tree
+
     # Create socketio controller
     controller = SocketioController(url)
 
@@ -60,15 +72,21 @@ def main_opt(
     win.signal_load_obstacles.connect(win.game_view.load_obstacles)
     win.signal_save_obstacles.connect(win.game_view.save_obstacles)
 
-    # Connect Controller signals to robot manager
-    controller.signal_new_robot_pose_current.connect(robot_manager.new_robot_pose_current)
+    # Connect Controller signals to robot manager.
+    # Robot poses current are emitted from the Qt thread by the controller, so they can be delivered directly.
+    # Other controller signals are emitted from socket.io client threads and are queued to the Qt thread.
+    controller.signal_new_robot_pose_current.connect(
+        robot_manager.new_robot_pose_current,
+        QtCore.Qt.DirectConnection,
+    )
     controller.signal_new_robot_pose_order.connect(robot_manager.new_robot_pose_order)
     controller.signal_new_dyn_obstacles.connect(robot_manager.set_dyn_obstacles)
     controller.signal_add_robot.connect(robot_manager.add_robot)
     controller.signal_del_robot.connect(robot_manager.del_robot)
     controller.signal_start_sensors_emulation.connect(robot_manager.start_sensors_emulation)
     controller.signal_stop_sensors_emulation.connect(robot_manager.stop_sensors_emulation)
-    robot_manager.sensors_emit_data_signal.connect(controller.emit_sensors_data)
+    # Pure forwarding to the socket.io client, which does not touch the UI
+    robot_manager.sensors_emit_data_signal.connect(controller.emit_sensors_data, QtCore.Qt.DirectConnection)
 
     # Connect Controller signals to UI slots
     controller.signal_new_console_text.connect(win.log_text.append)
@@ -76,7 +94,7 @@ def main_opt(
     controller.signal_add_robot.connect(win.add_robot)
     controller.signal_del_robot.connect(win.del_robot)
     controller.signal_starter_changed.connect(win.starter_changed)
-    controller.signal_new_robot_pose_current.connect(win.new_robot_pose)
+    controller.signal_new_robot_pose_current.connect(win.new_robot_pose, QtCore.Qt.DirectConnection)
     controller.signal_new_robot_state.connect(win.new_robot_state)
     controller.signal_connected.connect(win.connected)
     controller.signal_exit.connect(win.close)
@@ -64,6 +64,7 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         super().__init__(*args, **kwargs)
         self.robot_status_row: dict[int, int] = {}
+        self.robot_status_pose: dict[int, tuple[int, int, int]] = {}  # Pose currently displayed in the status bar
         self.robot_starters: dict[int, QtWidgets.QCheckBox] = {}
         self.charts_view: dict[int, ChartsView] = {}
         self.available_chart_views: list[ChartsView] = []
@@ -308,6 +309,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Status bar
         row = self.robot_status_row.pop(robot_id)
+        self.robot_status_pose.pop(robot_id, None)
         if not row:
             return
 
@@ -341,9 +343,20 @@ class MainWindow(QtWidgets.QMainWindow):
         row = self.robot_status_row.get(robot_id)
         if not row:
             return
-        self.status_layout.itemAtPosition(row, 2).widget().setText(f"{int(pose.x):> #6d}")
-        self.status_layout.itemAtPosition(row, 3).widget().setText(f"{int(pose.y):> #6d}")
-        self.status_layout.itemAtPosition(row, 4).widget().setText(f"{int(pose.O):> #4d}")
+
+        # Only update labels whose displayed value has changed
+        x, y, angle = int(pose.x), int(pose.y), int(pose.O)
+        last_x, last_y, last_angle = self.robot_status_pose.get(robot_id, (None, None, None))
+        if (x, y, angle) == (last_x, last_y, last_angle):
+            return
+        self.robot_status_pose[robot_id] = (x, y, angle)
+
+        if x != last_x:
+            self.status_layout.itemAtPosition(row, 2).widget().setText(f"{x:> #6d}")
+        if y != last_y:
+            self.status_layout.itemAtPosition(row, 3).widget().setText(f"{y:> #6d}")
+        if angle != last_angle:
+            self.status_layout.itemAtPosition(row, 4).widget().setText(f"{angle:> #4d}")
 
     @qtSlot(RobotState)
     def new_robot_state(self, robot_id: int, state: RobotState):
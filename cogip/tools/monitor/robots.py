@@ -11,10 +11,11 @@ class RobotManager(QtCore.QObject):
     """
 
     Attributes:
-        sensors_emit_data_signal: Qt Signal emitting sensors data
+        sensors_emit_data_signal: Qt Signal emitting sensors data,
+            the list of distances is passed as a Python object, without conversion
     """
 
-    sensors_emit_data_signal: qtSignal = qtSignal(int, list)
+    sensors_emit_data_signal: qtSignal = qtSignal(int, object)
 
     def __init__(self, game_view: GameView):
         """
@@ -45,7 +46,7 @@ class RobotManager(QtCore.QObject):
         if self._available_robots.get(robot_id) is None:
             robot = RobotEntity(robot_id, self._game_view.scene_entity)
             self._game_view.add_asset(robot)
-            robot.sensors_emit_data_signal.connect(self.emit_sensors_data)
+            robot.sensors_emit_data_signal.connect(self.emit_sensors_data, QtCore.Qt.DirectConnection)
             robot.setEnabled(False)
             self._available_robots[robot_id] = robot
 
@@ -113,7 +114,7 @@ class RobotManager(QtCore.QObject):
         self._sensors_emulation[robot_id] = False
         robot = self._robots.get(robot_id)
         if robot:
-            robot.start_sensors_emulation()
+            robot.stop_sensors_emulation()
 
     def emit_sensors_data(self, robot_id: int, data: list[int]) -> None:
         """
@@ -137,46 +138,36 @@ class RobotManager(QtCore.QObject):
         Arguments:
             dyn_obstacles: List of obstacles sent by the firmware through the serial port
         """
-        # Store new and already existing dyn obstacles
-        current_rect_obstacles = []
-        current_round_obstacles = []
+        # The first obstacles of each pool are used, the remaining ones are disabled
+        rect_pool = self._rect_obstacles_pool
+        round_pool = self._round_obstacles_pool
+        nb_rect = nb_round = 0
 
         for dyn_obstacle in dyn_obstacles:
             if isinstance(dyn_obstacle, DynObstacleRect):
-                if len(self._rect_obstacles_pool):
-                    obstacle = self._rect_obstacles_pool.pop(0)
-                    obstacle.setEnabled(True)
-                else:
-                    obstacle = DynRectObstacleEntity(self._game_view.scene_entity)
+                if nb_rect == len(rect_pool):
+                    rect_pool.append(DynRectObstacleEntity(self._game_view.scene_entity))
+                obstacle = rect_pool[nb_rect]
+                nb_rect += 1
+                obstacle.setEnabled(True)
 
                 obstacle.set_position(x=dyn_obstacle.x, y=dyn_obstacle.y, rotation=dyn_obstacle.angle)
                 obstacle.set_size(length=dyn_obstacle.length_y, width=dyn_obstacle.length_x)
                 obstacle.set_bounding_box(dyn_obstacle.bb)
-
-                current_rect_obstacles.append(obstacle)
             else:
                 # Round obstacle
-                if len(self._round_obstacles_pool):
-                    obstacle = self._round_obstacles_pool.pop(0)
-                    obstacle.setEnabled(True)
-                else:
-                    obstacle = DynCircleObstacleEntity(self._game_view.scene_entity)
+                if nb_round == len(round_pool):
+                    round_pool.append(DynCircleObstacleEntity(self._game_view.scene_entity))
+                obstacle = round_pool[nb_round]
+                nb_round += 1
+                obstacle.setEnabled(True)
 
                 obstacle.set_position(x=dyn_obstacle.x, y=dyn_obstacle.y, radius=dyn_obstacle.radius)
                 obstacle.set_bounding_box(dyn_obstacle.bb)
 
-                current_round_obstacles.append(obstacle)
-
         # Disable remaining dyn obstacles
-        while len(self._rect_obstacles_pool):
-            dyn_obstacle = self._rect_obstacles_pool.pop(0)
-            dyn_obstacle.setEnabled(False)
-            current_rect_obstacles.append(dyn_obstacle)
-
-        while len(self._round_obstacles_pool):
-            dyn_obstacle = self._round_obstacles_pool.pop(0)
-            dyn_obstacle.setEnabled(False)
-            current_round_obstacles.append(dyn_obstacle)
-
-        self._rect_obstacles_pool = current_rect_obstacles
-        self._round_obstacles_pool = current_round_obstacles
+        for index in range(nb_rect, len(rect_pool)):
+            rect_pool[index].setEnabled(False)
+
+        for index in range(nb_round, len(round_pool)):
+            round_pool[index].setEnabled(False)
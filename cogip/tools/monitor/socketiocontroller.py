@@ -1,5 +1,4 @@
-import time
-from threading import Thread
+from threading import Event, Thread
 from typing import Any
 
 import polling2
@@ -12,6 +11,7 @@ from PySide6.QtCore import Slot as qtSlot
 from cogip import logger
 from cogip.models import models
 from cogip.models.actuators import ActuatorCommand, ActuatorState
+from cogip.utils.ringbuffer import RingBuffer
 
 
 class SocketioController(QtCore.QObject):
@@ -56,6 +56,12 @@ class SocketioController(QtCore.QObject):
             Qt signal emitted on Planner reset command
         signal_starter_changed:
             Qt signal emitted the starter state has changed
+        signal_poses_available:
+            Qt signal emitted when robot poses are waiting in the pose ring
+        poses_flush_interval:
+            Maximum delay in milliseconds before received robot poses are emitted
+        poses_flush_threshold:
+            Number of pending robot poses above which they are emitted without delay
     """
 
     signal_new_console_text: qtSignal = qtSignal(str)
@@ -77,6 +83,9 @@ class SocketioController(QtCore.QObject):
     signal_actuator_state: qtSignal = qtSignal(object)
     signal_planner_reset: qtSignal = qtSignal()
     signal_starter_changed: qtSignal = qtSignal(int, bool)
+    signal_poses_available: qtSignal = qtSignal()
+    poses_flush_interval: int = 16
+    poses_flush_threshold: int = 8
 
     def __init__(self, url: str):
         """
@@ -89,26 +98,46 @@ class SocketioController(QtCore.QObject):
 
         self.url = url
         self.sio = socketio.Client()
+        self._stop_connection = Event()
         self.register_handlers()
 
         self.menus: dict[str, models.ShellMenu | None] = {}
 
+        # Robot poses are received in socket.io client threads (each message is handled in its own thread)
+        # and consumed in the Qt thread.
+        # Only notify the Qt thread when it has not been notified yet,
+        # it will then process all poses received in the meantime at once.
+        # The flag is cleared before draining the ring, so a pose added without notification is always drained.
+        # Only the latest pose of each robot is displayed, so the ring is kept small:
+        # if the Qt thread stalls, oldest poses are dropped instead of piling up.
+        self._poses = RingBuffer(64)
+        self._poses_notify_pending = False
+        # Emitted from socket.io client threads, so the slot must be queued to the Qt thread
+        self.signal_poses_available.connect(self.poses_available, QtCore.Qt.QueuedConnection)
+
+        # Intermediate poses are not visible, so only emit the latest pose of each robot once per frame
+        self._poses_flush_timer = QtCore.QTimer()
+        self._poses_flush_timer.setSingleShot(True)
+        self._poses_flush_timer.setInterval(self.poses_flush_interval)
+        self._poses_flush_timer.timeout.connect(self.flush_poses)
+
     def start(self):
         """
         Connect to socket.io server.
         """
         # Poll in background to wait for the first connection.
         # Disconnections/reconnections are handle directly by the client.
-        self._retry_connection = True
+        self._stop_connection.clear()
         Thread(target=self.try_connect).start()
 
     def try_connect(self):
-        while self._retry_connection:
+        while not self._stop_connection.is_set():
             try:
                 self.sio.connect(self.url, namespaces=["/monitor", "/dashboard"])
             except socketio.exceptions.ConnectionError as ex:
                 print(ex)
-                time.sleep(2)
+                # Wait before retrying, but wake up immediately on stop
+                self._stop_connection.wait(2)
                 continue
             break
 
@@ -116,7 +145,7 @@ class SocketioController(QtCore.QObject):
         """
         Disconnect from socket.io server.
         """
-        self._retry_connection = False
+        self._stop_connection.set()
         if self.sio.connected:
             self.sio.disconnect()
 
@@ -169,6 +198,34 @@ class SocketioController(QtCore.QObject):
     def starter_changed(self, robot_id, pushed: bool):
         self.sio.emit("starter_changed", pushed, namespace="/monitor")
 
+    @qtSlot()
+    def poses_available(self):
+        """
+        Qt Slot
+
+        Schedule the emission of pending robot poses,
+        or emit them immediately if too many are pending.
+        """
+        if len(self._poses) > self.poses_flush_threshold:
+            self.flush_poses()
+        elif not self._poses_flush_timer.isActive():
+            self._poses_flush_timer.start()
+
+    @qtSlot()
+    def flush_poses(self):
+        """
+        Qt Slot
+
+        Emit the latest pose of each robot received since the last call.
+        """
+        self._poses_flush_timer.stop()
+        self._poses_notify_pending = False
+        latest_poses: dict[int, models.Pose] = {}
+        for robot_id, pose in self._poses.pop_all():
+            latest_poses[robot_id] = pose
+        for robot_id, pose in latest_poses.items():
+            self.signal_new_robot_pose_current.emit(robot_id, pose)
+
     def on_menu(self, menu_name: str, data):
         menu = models.ShellMenu.model_validate(data)
         if self.menus.get(menu_name) != menu:
@@ -212,7 +269,7 @@ class SocketioController(QtCore.QObject):
                 and message == "A monitor is already connected"
             ):
                 logger.error(f"Error: {message}.")
-                self._retry_connection = False
+                self._stop_connection.set()
                 self.signal_exit.emit()
                 return
             logger.error(f"Monitor connection error: {data}")
@@ -273,7 +330,11 @@ class SocketioController(QtCore.QObject):
             Callback on robot pose current message.
             """
             pose = models.Pose.model_validate(data)
-            self.signal_new_robot_pose_current.emit(robot_id, pose)
+            # If the ring is full, the Qt thread is stalled, so drop the pose
+            self._poses.put((robot_id, pose))
+            if not self._poses_notify_pending or len(self._poses) == self.poses_flush_threshold + 1:
+                self._poses_notify_pending = True
+                self.signal_poses_available.emit()
 
         @self.sio.on("pose_order", namespace="/dashboard")
         def on_pose_order(robot_id: int, data: dict[str, Any]) -> None:
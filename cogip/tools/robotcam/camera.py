@@ -13,7 +13,7 @@ import socketio
 
 from cogip import logger
 from cogip.tools.camera.arguments import CameraName, VideoCodec
-from .settings import Settings
+from .settings import get_settings
 
 
 class ExitSignal(Exception):
@@ -38,7 +38,7 @@ class CameraHandler:
 
         Create SocketIO client and connect to server.
         """
-        self.settings = Settings()
+        self.settings = get_settings()
         signal.signal(signal.SIGTERM, self.exit_handler)
 
         self.record_filename: Path | None = None
@@ -26,7 +26,7 @@ from cogip.tools.camera.utils import (
     load_camera_intrinsic_params,
     rotate_2d,
 )
-from .settings import Settings
+from .settings import get_settings
 
 
 class CameraServer:
@@ -46,7 +46,7 @@ class CameraServer:
 
         Create FastAPI application and SocketIO client.
         """
-        self.settings = Settings()
+        self.settings = get_settings()
         CameraServer._exiting = False
 
         self.app = FastAPI(title="COGIP Robot Camera Streamer", debug=False)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Annotated
 
 from pydantic import AnyHttpUrl, Field, FilePath, ValidationInfo, field_validator
@@ -82,3 +83,11 @@ class Settings(BaseSettings):
         if v is None:
             return f"http://localhost:809{robot_id}"
         return v
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the settings, parsed from the environment on first call only.
+    """
+    return Settings()
@@ -0,0 +1,76 @@
+import collections
+import queue
+from typing import Any
+
+
+class RingBuffer:
+    """
+    Bounded buffer passing items from producer threads to a consumer thread.
+
+    The ring is bounded and drops the oldest items when it is full:
+    producers never block and the consumer always gets the most recent items,
+    which is what matters for streams of states like robot poses.
+
+    It is based on a `collections.deque` with a maximum length,
+    whose `append` and `popleft` operations are thread-safe,
+    so it can be used by several producer threads without a lock.
+
+    It exposes the `put`/`get_nowait` interface of `queue.Queue`,
+    and [`pop_all`][cogip.utils.ringbuffer.RingBuffer.pop_all] to drain it at once.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Class constructor.
+
+        Arguments:
+            capacity: maximum number of items stored in the ring
+        """
+        self._items: collections.deque[Any] = collections.deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return len(self._items) == self._items.maxlen
+
+    def put(self, item: Any):
+        """
+        Add an item to the ring.
+
+        If the ring is full, the oldest item is dropped.
+
+        Arguments:
+            item: item to add
+        """
+        self._items.append(item)
+
+    def get_nowait(self) -> Any:
+        """
+        Remove and return the oldest item.
+
+        Raises:
+            queue.Empty: if the ring is empty
+        """
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def pop_all(self) -> list[Any]:
+        """
+        Remove and return all available items, oldest first.
+
+        Items added by producers while draining are also returned.
+        """
+        items = []
+        popleft = self._items.popleft
+        try:
+            while True:
+                items.append(popleft())
+        except IndexError:
+            pass
+        return items
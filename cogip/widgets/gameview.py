@@ -17,6 +17,7 @@ from cogip.entities.line import LineEntity
 from cogip.entities.obstacle import ObstacleEntity
 from cogip.entities.path import PathEntity
 from cogip.entities.robot_manual import RobotManualEntity
+from cogip.entities.sensor import Sensor
 from cogip.models import models
 
 
@@ -133,6 +134,10 @@ class GameView(QtWidgets.QWidget):
         mouse_enabled: True to authorize translation and rotation of the scene using the mouse,
             False when an other object (obstacle, manual robot, ...) is picked.
         new_move_delta: signal emitted to movable entities when a mouse drag is detected
+        move_delta_interval: minimum interval between two `new_move_delta` signals (in ms),
+            mouse moves in between are accumulated
+        move_delta_min: minimum accumulated translation to emit a `new_move_delta` signal (in mm),
+            the remainder is emitted when the mouse button is released
     """
 
     ground_image: Path = Path("assets/table2024.png")
@@ -140,6 +145,8 @@ class GameView(QtWidgets.QWidget):
     plane_intersection: QtGui.QVector3D = None
     mouse_enabled: bool = True
     new_move_delta: qtSignal = qtSignal(QtGui.QVector3D)
+    move_delta_interval: int = 16
+    move_delta_min: float = 0.5
 
     def __init__(self):
         """
@@ -224,6 +231,18 @@ class GameView(QtWidgets.QWidget):
         # Create object picker
         self.create_object_picker()
 
+        # Coalesce mouse moves to emit at most one move delta per frame
+        self.pending_move_delta = QtGui.QVector3D()
+        self.move_delta_timer = QtCore.QTimer(self)
+        self.move_delta_timer.setSingleShot(True)
+        self.move_delta_timer.setInterval(self.move_delta_interval)
+        self.move_delta_timer.timeout.connect(self.flush_move_delta)
+
+        # Number of assets added to the view and still loading
+        self.pending_assets = 0
+        self.robot_manual: RobotManualEntity | None = None
+        self.pami_manual: RobotManualEntity | None = None
+
         # Add image on table floor
         self.add_ground_image()
 
@@ -267,11 +286,29 @@ class GameView(QtWidgets.QWidget):
             asset: The asset entity to add to the vew
         """
         asset.setParent(self.scene_entity)
-        asset.ready.connect(self.asset_ready)
+        if not asset.asset_ready:
+            self.pending_assets += 1
+            asset.ready.connect(self.asset_ready)
 
     def add_obstacle(self, x: int = 0, y: int = 0, rotation: int = 0, **kwargs) -> ObstacleEntity:
         """
-        Create a new obstacle in the 3D view.
+        Create a new obstacle in the 3D view, detected by the sensors.
+
+        Arguments:
+            x: X position
+            y: Y position
+            rotation: Rotation
+
+        Return:
+            The obstacle entity
+        """
+        obstacle_entity = self.create_obstacle(x, y, rotation, **kwargs)
+        Sensor.add_obstacle(obstacle_entity)
+        return obstacle_entity
+
+    def create_obstacle(self, x: int = 0, y: int = 0, rotation: int = 0, **kwargs) -> ObstacleEntity:
+        """
+        Create a new obstacle in the 3D view, without registering it to the sensors.
 
         Arguments:
             x: X position
@@ -285,6 +322,7 @@ class GameView(QtWidgets.QWidget):
         obstacle_entity.setParent(self.scene_entity)
         self.obstacle_entities.append(obstacle_entity)
         obstacle_entity.enable_controller.connect(self.enable_mouse)
+        obstacle_entity.move_released.connect(self.release_move_delta)
         self.new_move_delta.connect(obstacle_entity.new_move_delta)
         return obstacle_entity
 
@@ -292,13 +330,16 @@ class GameView(QtWidgets.QWidget):
         """
         Load obstacles from a JSON file.
 
+        The loaded obstacles are registered to the sensors at once.
+
         Arguments:
             filename: path of the JSON file
         """
         try:
             obstacle_models = TypeAdapter(models.ObstacleList).validate_json(filename.read_text())
-            for obstacle_model in obstacle_models:
-                self.add_obstacle(**obstacle_model.model_dump())
+            Sensor.add_obstacles(
+                [self.create_obstacle(**obstacle_model.model_dump()) for obstacle_model in obstacle_models]
+            )
         except ValidationError as exc:
             print(exc)
 
@@ -318,16 +359,19 @@ class GameView(QtWidgets.QWidget):
     def asset_ready(self):
         """
         Create artifacts when all assets are ready (loading assets is done in background).
+
+        Assets still loading are counted by [add_asset][cogip.widgets.gameview.GameView.add_asset],
+        instead of searching the whole scene for them each time an asset is ready.
         """
-        child_assets_not_ready = [
-            child for child in self.scene_entity.findChildren(AssetEntity) if not child.asset_ready
-        ]
-        if len(child_assets_not_ready) == 0:
+        self.pending_assets -= 1
+        if self.pending_assets == 0 and self.robot_manual is None:
             self.robot_manual = RobotManualEntity(self.scene_entity, self.container)
             self.robot_manual.enable_controller.connect(self.enable_mouse)
+            self.robot_manual.move_released.connect(self.release_move_delta)
             self.new_move_delta.connect(self.robot_manual.new_move_delta)
             self.pami_manual = RobotManualEntity(self.scene_entity, self.container, robot_id=2, y=-1200)
             self.pami_manual.enable_controller.connect(self.enable_mouse)
+            self.pami_manual.move_released.connect(self.release_move_delta)
             self.new_move_delta.connect(self.pami_manual.new_move_delta)
 
             print(f"Load time of assets: {timeit.default_timer() - self.start_time:0.3f}s")
@@ -347,32 +391,62 @@ class GameView(QtWidgets.QWidget):
         Compute the translation on the plane entity between the
         current `moved` mouse event and the previous one.
 
-        Emit the `new_move_delta` signal to update the corresponding asset's position.
+        The translation is accumulated and the `new_move_delta` signal is emitted
+        at most once per `move_delta_interval` to update the corresponding asset's position.
         """
         if pick.buttons() != QtCore.Qt.MouseButton.LeftButton.value:
             return
 
         new_intersection = pick.worldIntersection()
         delta: QtGui.QVector3D = new_intersection - self.plane_intersection
-        delta.setZ(0)
-        rot_z = self.root_transform.rotationZ()
-        delta = QtGui.QVector3D(
-            -delta.x() * math.cos(math.radians(rot_z)) - delta.y() * math.sin(math.radians(rot_z)),
-            -delta.y() * math.cos(math.radians(rot_z)) + delta.x() * math.sin(math.radians(rot_z)),
-            0,
-        )
-        self.new_move_delta.emit(delta)
+        rot_z = math.radians(self.root_transform.rotationZ())
+        cos_z, sin_z = math.cos(rot_z), math.sin(rot_z)
+        dx, dy = delta.x(), delta.y()
+        self.pending_move_delta += QtGui.QVector3D(-dx * cos_z - dy * sin_z, -dy * cos_z + dx * sin_z, 0)
+        if not self.move_delta_timer.isActive():
+            self.move_delta_timer.start()
         self.plane_intersection = new_intersection
 
+    def flush_move_delta(self, force: bool = False):
+        """
+        Emit the `new_move_delta` signal with the translation accumulated since the last one.
+
+        Sub-millimeter translations are kept accumulated instead of moving the entity,
+        unless `force` is set. The remainder is forced by
+        [release_move_delta][cogip.widgets.gameview.GameView.release_move_delta]
+        on the first `released` mouse event, while the moved entity still applies move deltas.
+
+        Arguments:
+            force: emit any non-null accumulated translation
+        """
+        if self.pending_move_delta.isNull():
+            return
+        if not force and self.pending_move_delta.lengthSquared() < self.move_delta_min**2:
+            return
+        self.new_move_delta.emit(self.pending_move_delta)
+        self.pending_move_delta = QtGui.QVector3D()
+
     def plane_released(self, pick: Qt3DRender.QPickEvent):
         """
         Emit the `new_move_delta` signal with `None` argument,
         on `released` mouse event, to notify that mouse button was released
         and no further moves will happen until next `pressed` mouse event.
         """
+        self.release_move_delta()
         self.plane_intersection = None
         self.new_move_delta.emit(None)
 
+    def release_move_delta(self):
+        """
+        Emit the `new_move_delta` signal with the translation accumulated since the last one,
+        when the mouse button is released.
+
+        It is called on the first `released` mouse event, either from the plane entity
+        or from the moved entity, before the moved entity stops applying move deltas.
+        """
+        self.move_delta_timer.stop()
+        self.flush_move_delta(force=True)
+
     def add_robot(self, robot_id: int) -> None:
         """
         Add a new robot status bar.
@@ -477,7 +551,7 @@ class GameView(QtWidgets.QWidget):
 
         ground_texture = Qt3DRender.QTexture2D(ground_material)
         ground_texture_image = Qt3DRender.QTextureImage(ground_texture)
-        ground_texture_image.setSource(QtCore.QUrl(f"file:{self.ground_image}"))
+        ground_texture_image.setSource(QtCore.QUrl.fromLocalFile(str(self.ground_image)))
         ground_texture_image.setMirrored(False)
         ground_texture.addTextureImage(ground_texture_image)
         ground_material.setTexture(ground_texture)
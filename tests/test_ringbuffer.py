@@ -0,0 +1,89 @@
+import queue
+import threading
+import unittest
+
+from cogip.utils.ringbuffer import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_put_get(self):
+        ring = RingBuffer(4)
+        self.assertTrue(ring.empty())
+        ring.put(1)
+        ring.put(2)
+        self.assertEqual(len(ring), 2)
+        self.assertEqual(ring.get_nowait(), 1)
+        self.assertEqual(ring.get_nowait(), 2)
+        self.assertRaises(queue.Empty, ring.get_nowait)
+
+    def test_overwrite_oldest(self):
+        ring = RingBuffer(3)
+        for i in range(5):
+            ring.put(i)
+        self.assertTrue(ring.full())
+        self.assertEqual(len(ring), 3)
+        self.assertEqual(ring.get_nowait(), 2)
+        self.assertEqual(ring.pop_all(), [3, 4])
+
+    def test_pop_all(self):
+        ring = RingBuffer(8)
+        self.assertEqual(ring.pop_all(), [])
+        for i in range(3):
+            ring.put(i)
+        self.assertEqual(ring.pop_all(), [0, 1, 2])
+        self.assertTrue(ring.empty())
+        ring.put(3)
+        self.assertEqual(ring.pop_all(), [3])
+
+    def test_pop_all_after_overwrite(self):
+        ring = RingBuffer(4)
+        for i in range(10):
+            ring.put(i)
+        self.assertEqual(ring.pop_all(), [6, 7, 8, 9])
+        self.assertEqual(ring.pop_all(), [])
+
+    def test_concurrent_producers(self):
+        nb_producers = 8
+        nb_items = 10000
+        ring = RingBuffer(nb_producers * nb_items)
+
+        def produce(producer_id: int):
+            for i in range(nb_items):
+                ring.put((producer_id, i))
+
+        threads = [threading.Thread(target=produce, args=(n,)) for n in range(nb_producers)]
+        for thread in threads:
+            thread.start()
+        items = []
+        while any(thread.is_alive() for thread in threads):
+            items.extend(ring.pop_all())
+        for thread in threads:
+            thread.join()
+        items.extend(ring.pop_all())
+
+        self.assertEqual(len(items), nb_producers * nb_items)
+        for producer_id in range(nb_producers):
+            self.assertEqual([i for n, i in items if n == producer_id], list(range(nb_items)))
+
+    def test_concurrent_producers_keep_latest(self):
+        nb_producers = 8
+        nb_items = 10000
+        ring = RingBuffer(4)
+
+        def produce(producer_id: int):
+            for i in range(nb_items):
+                ring.put((producer_id, i))
+
+        threads = [threading.Thread(target=produce, args=(n,)) for n in range(nb_producers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        items = ring.pop_all()
+        self.assertEqual(len(items), 4)
+        self.assertTrue(ring.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()